@@ -19,6 +19,7 @@ from pytest_data_loader.exceptions import DataNotFound
 from pytest_data_loader.loaders.impl import create_loaders
 from pytest_data_loader.loaders.loaders import load
 from pytest_data_loader.types import (
+    EMPTY_READ_OPTIONS,
     DataLoader,
     DataLoaderFunctionType,
     DataLoaderLoadAttrs,
@@ -41,6 +42,9 @@ __all__ = ["DataLoaderFixture", "data_loader"]
 
 logger = logging.getLogger(__name__)
 
+# The @load data loader typed as DataLoader, which the data_loader fixture uses to load files
+_LOAD: DataLoader = load  # type: ignore[assignment]
+
 
 @pytest.fixture
 def data_loader(request: FixtureRequest, pytestconfig: Config) -> DataLoaderFixture:
@@ -100,13 +104,13 @@ class DataLoaderFixture:
         :param read_options: File read options the plugin passes to open() when reading the file
         :param onload: A function to transform or preprocess loaded data before passing it to the test function
         """
-        loader = cast(DataLoader, load)
+        loader = _LOAD
         validated_path = cast(Path, validate_path(path, loader=loader, recursive=False))
         validate_reader(reader)
         validate_read_options(read_options)
         validate_loader_func(onload, loader=loader, func_type=DataLoaderFunctionType.ONLOAD_FUNC)
 
-        hashable_read_options = HashableDict(read_options or {})
+        hashable_read_options = HashableDict(read_options) if read_options else EMPTY_READ_OPTIONS
         cache_key = (str(validated_path), reader, onload, tuple(sorted(hashable_read_options.items())))
         if cache_key in self._cache:
             return self._cache[cache_key]
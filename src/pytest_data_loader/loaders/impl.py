@@ -37,6 +37,7 @@ from pytest_data_loader.types import (
     LazyLoadedData,
     LazyLoadedPartData,
     LoadedData,
+    PartMeta,
 )
 from pytest_data_loader.utils import can_decode, normalize_loader_func
 from pytest_data_loader.validators import validate_read_options, validate_reader
@@ -50,11 +51,12 @@ logger = logging.getLogger(__name__)
 
 def loader(f: Callable[P, R]) -> Callable[P, R]:
     """Decorator to register a decorated function as a data loader"""
+    loader_type = DataLoaderType(f.__name__)
     f.is_data_loader = True  # type: ignore[attr-defined]
-    f.type = DataLoaderType(f.__name__)  # type: ignore[attr-defined]
-    f.is_file_loader = f.type in [DataLoaderType.LOAD, DataLoaderType.PARAMETRIZE]  # type: ignore[attr-defined]
-    f.requires_parametrization = f.type in [DataLoaderType.PARAMETRIZE, DataLoaderType.PARAMETRIZE_DIR]  # type: ignore[attr-defined]
-    f.should_split_data = f.type == DataLoaderType.PARAMETRIZE  # type: ignore[attr-defined]
+    f.type = loader_type  # type: ignore[attr-defined]
+    f.is_file_loader = loader_type in (DataLoaderType.LOAD, DataLoaderType.PARAMETRIZE)  # type: ignore[attr-defined]
+    f.requires_parametrization = loader_type in (DataLoaderType.PARAMETRIZE, DataLoaderType.PARAMETRIZE_DIR)  # type: ignore[attr-defined]
+    f.should_split_data = loader_type is DataLoaderType.PARAMETRIZE  # type: ignore[attr-defined]
     return f
 
 
@@ -97,11 +99,16 @@ def create_loaders(
                 raise DataNotFound(f"The provided path does not exist: {str(path)!r}")
             file_or_dir_paths = (path,)
     else:
+        # Search from the test file's directory rather than the file itself. The lookup result only depends on the
+        # directory, so that the memoized result is shared by all test files in the same directory
+        search_from = load_attrs.search_from
+        if search_from.is_file():
+            search_from = search_from.parent
         data_dir_path, file_or_dir_paths = resolve_relative_path(
             data_loader_option.loader_dir_name,
             data_loader_option.loader_root_dir,
             path,
-            load_attrs.search_from,
+            search_from,
             is_file=is_file,
         )
 
@@ -183,10 +190,7 @@ class Loader(ABC):
 
         :param module: The module object the cache is attached to
         """
-        cache: set[Loader] | None = getattr(module, PYTEST_DATA_LOADER_MODULE_CACHE, None)
-        if cache is None:
-            cache = set()
-            setattr(module, PYTEST_DATA_LOADER_MODULE_CACHE, cache)
+        cache: set[Loader] = module.__dict__.setdefault(PYTEST_DATA_LOADER_MODULE_CACHE, set())
         cache.add(self)
 
 
@@ -237,7 +241,7 @@ class FileLoader(Loader):
 
         if mode := self.read_options.get("mode"):
             self._effective_read_mode = mode
-        elif any(x in self.read_options for x in ("encoding", "newline")):
+        elif "encoding" in self.read_options or "newline" in self.read_options:
             self._effective_read_mode = "r"
         else:
             # This will be identified on the first file read
@@ -264,7 +268,7 @@ class FileLoader(Loader):
         @wraps(f)
         def _parametrizer_func(*args: Any, **kwargs: Any) -> Iterable[Any]:
             parametrized_data: Any = f(*args, **kwargs)
-            if not isinstance(parametrized_data, Iterable) or isinstance(parametrized_data, str | bytes):
+            if not isinstance(parametrized_data, Iterable) or isinstance(parametrized_data, (str, bytes)):
                 t = parametrized_data if isinstance(parametrized_data, type) else type(parametrized_data)
                 raise ValueError(f"Parametrized data must be an iterable container, not {t.__name__}")
             return parametrized_data
@@ -428,7 +432,7 @@ class FileLoader(Loader):
                         resolver=partial(self._load_part_data_now, pos=pos, gidx=gidx),
                         idx=i,
                         pos=pos,
-                        meta=dict(marks=marks, id=param_id),
+                        meta=PartMeta(id=param_id, marks=marks),
                         gidx=gidx,
                     )
                     for i, (gidx, pos, marks, param_id) in enumerate(scan_results)
@@ -458,7 +462,7 @@ class FileLoader(Loader):
                             loaded_from=self.load_from,
                             resolver=resolver,
                             idx=i,
-                            meta=dict(
+                            meta=PartMeta(
                                 marks=self.load_attrs.marker_func(gidx, self.path, data.data)
                                 if self.load_attrs.marker_func
                                 else None,
@@ -693,7 +697,7 @@ class DirectoryLoader(Loader):
                         file_cache=self._file_cache,
                     )
                     loaded_data = file_loader.load()
-                    assert isinstance(loaded_data, LoadedData | LazyLoadedData), type(loaded_data)
+                    assert isinstance(loaded_data, (LoadedData, LazyLoadedData)), type(loaded_data)
                     self._file_loaders.append(file_loader)
                     loaded_files.append(loaded_data)
 
@@ -1,33 +1,41 @@
+from __future__ import annotations
+
 import inspect
-from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any
 
 from pytest_data_loader.constants import PYTEST_DATA_LOADER_ATTRS
 from pytest_data_loader.loaders.impl import loader
-from pytest_data_loader.types import (
-    DataLoader,
-    DataLoaderLoadAttrs,
-    FileReader,
-    FilterFunc,
-    Func,
-    IdFunc,
-    MarkerFunc,
-    OnloadFunc,
-    ParametrizerFunc,
-    PathFilterFunc,
-    PathIdFunc,
-    PathMarkerFunc,
-    ProcessorFunc,
-    PytestMarkType,
-    ReaderFunc,
-    ReadOptions,
-    ReadOptionsFunc,
-)
+from pytest_data_loader.types import DataLoaderLoadAttrs
 from pytest_data_loader.validators import validate_loader_options
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+
+    from pytest_data_loader.types import (
+        DataLoader,
+        FileReader,
+        FilterFunc,
+        Func,
+        IdFunc,
+        MarkerFunc,
+        OnloadFunc,
+        ParametrizerFunc,
+        PathFilterFunc,
+        PathIdFunc,
+        PathMarkerFunc,
+        ProcessorFunc,
+        PytestMarkType,
+        ReaderFunc,
+        ReadOptions,
+        ReadOptionsFunc,
+    )
+
 __all__ = ["load", "parametrize", "parametrize_dir"]
 
+# Absolute source file paths of decorated test functions, keyed by their code filename
+_ABS_SOURCE_FILES: dict[str, Path] = {}
+
 
 @loader
 def load(
@@ -79,10 +87,10 @@ def load(
     >>>     assert data == {"key": "value"}
     """
     return _setup_data_loader(
-        cast(DataLoader, load),
+        _LOAD,
         fixture_names,
         path,
-        lazy_loading=lazy_loading,
+        lazy_loading,
         reader=reader,
         read_options=read_options,
         onload=onload,
@@ -178,10 +186,10 @@ def parametrize(
     >>>
     """
     return _setup_data_loader(
-        cast(DataLoader, parametrize),
+        _PARAMETRIZE,
         fixture_names,
         path,
-        lazy_loading=lazy_loading,
+        lazy_loading,
         reader=reader,
         onload=onload,
         parametrizer=parametrizer,
@@ -259,10 +267,10 @@ def parametrize_dir(
     >>>     assert data in ["foo", "bar", "baz"]
     """
     return _setup_data_loader(
-        cast(DataLoader, parametrize_dir),
+        _PARAMETRIZE_DIR,
         fixture_names,
         path,
-        lazy_loading=lazy_loading,
+        lazy_loading,
         recursive=recursive,
         filter=filter,
         processor=processor,
@@ -273,13 +281,19 @@ def parametrize_dir(
     )
 
 
+# The data loaders typed as DataLoader, so that the decorators don't need to cast() themselves on every call
+_LOAD: DataLoader = load  # type: ignore[assignment]
+_PARAMETRIZE: DataLoader = parametrize  # type: ignore[assignment]
+_PARAMETRIZE_DIR: DataLoader = parametrize_dir  # type: ignore[assignment]
+
+
 def _setup_data_loader(
     loader: DataLoader,
     fixture_names: str | tuple[str, str],
     path: Path | str | Sequence[Path | str],
+    lazy_loading: bool,
     /,
     *,
-    lazy_loading: bool = True,
     recursive: bool = False,
     reader: FileReader | None = None,
     read_options: ReadOptions | ReadOptionsFunc | None = None,
@@ -313,7 +327,7 @@ def _setup_data_loader(
         """Add attributes to the test function. This supports stacking multiple data loaders"""
         load_attrs = DataLoaderLoadAttrs(
             loader=loader,
-            search_from=Path(inspect.getabsfile(test_func)),
+            search_from=_get_abs_source_file(test_func),
             **validated_options,
         )
         existing_load_attrs: list[DataLoaderLoadAttrs] | None = getattr(test_func, PYTEST_DATA_LOADER_ATTRS, None)
@@ -327,6 +341,21 @@ def _setup_data_loader(
     return wrapper
 
 
+def _get_abs_source_file(test_func: Func) -> Path:
+    """Return the absolute path of the file the test function is defined in. The result is cached per source file,
+    as all test functions in a module resolve to the same path
+
+    :param test_func: The test function decorated with a data loader
+    """
+    code = getattr(test_func, "__code__", None)
+    if code is None:
+        return Path(inspect.getabsfile(test_func))
+    abs_file = _ABS_SOURCE_FILES.get(code.co_filename)
+    if abs_file is None:
+        abs_file = _ABS_SOURCE_FILES[code.co_filename] = Path(inspect.getabsfile(test_func))
+    return abs_file
+
+
 def _check_fixture_name_collisions(
     test_func: Func,
     existing_load_attrs: list[DataLoaderLoadAttrs],
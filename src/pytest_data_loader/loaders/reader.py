@@ -1,14 +1,15 @@
 from __future__ import annotations
 
-import inspect
 import json
+import os
+import sys
 from collections import defaultdict
 from collections.abc import Callable, Generator
 from pathlib import Path
 from threading import RLock
 from typing import IO, Any, ClassVar
 
-from pytest_data_loader.types import HashableDict, ReadOptions
+from pytest_data_loader.types import EMPTY_READ_OPTIONS, HashableDict, ReadOptions
 from pytest_data_loader.validators import validate_read_options, validate_reader
 
 __all__ = ["register_reader"]
@@ -20,10 +21,15 @@ _LOCK = RLock()
 class FileReader:
     # Store registered readers by conftest paths
     _REGISTERED_READERS: ClassVar[dict[Path, dict[str, FileReader]]] = defaultdict(dict)
+    # Read-only snapshot of the registrations as (conftest directory prefix, readers by extension) pairs, ordered from
+    # the deepest conftest. Rebuilt and rebound as a whole on every registration change so that lookups need no lock
+    _SNAPSHOT: ClassVar[tuple[tuple[str, dict[str, FileReader]], ...]] = ()
+    # Memoized lookup results keyed by (search_from, ext). Replaced whenever the registrations change
+    _LOOKUP_CACHE: ClassVar[dict[tuple[Path, str], FileReader | None]] = {}
 
     def __init__(self, reader: Callable[..., Any] | None = None, read_options: ReadOptions | None = None) -> None:
         self.reader = reader
-        self.read_options = HashableDict(read_options or {})
+        self.read_options = HashableDict(read_options) if read_options else EMPTY_READ_OPTIONS
 
     @staticmethod
     def register(
@@ -45,6 +51,7 @@ class FileReader:
         with _LOCK:
             file_reader = FileReader(reader, read_options=read_options)
             FileReader._REGISTERED_READERS[conftest_path][ext] = file_reader
+            FileReader._on_registration_change()
         return file_reader
 
     @staticmethod
@@ -59,6 +66,18 @@ class FileReader:
 
         with _LOCK:
             del FileReader._REGISTERED_READERS[conftest_path][ext]
+            FileReader._on_registration_change()
+
+    @staticmethod
+    def _on_registration_change() -> None:
+        """Rebuild the registration snapshot and drop memoized lookups. Must be called while holding the lock"""
+        FileReader._SNAPSHOT = tuple(
+            (_to_dir_prefix(p.parent), dict(FileReader._REGISTERED_READERS[p]))
+            for p in sorted(FileReader._REGISTERED_READERS, key=lambda p: len(p.parts), reverse=True)
+        )
+        # NOTE: Rebind the cache after the snapshot. A lookup that picked up the new cache is guaranteed to also see
+        #       the new snapshot, and results computed from a stale snapshot only land in the discarded cache
+        FileReader._LOOKUP_CACHE = {}
 
     @staticmethod
     def get_registered_reader(search_from: Path, ext: str) -> FileReader | None:
@@ -68,18 +87,21 @@ class FileReader:
         :param ext: File extension to get a reader for
         """
         assert search_from.is_absolute()
-        if search_from.is_file():
-            search_from = search_from.parent
-
-        with _LOCK:
-            reader = None
-            for conftest_path in sorted(
-                FileReader._REGISTERED_READERS.keys(), key=lambda p: len(p.parents), reverse=True
-            ):
-                if search_from.is_relative_to(conftest_path.parent):
-                    if reader := FileReader._REGISTERED_READERS[conftest_path].get(ext):
-                        break
-            return reader or _DEFAULT_READERS.get(ext)
+        key = (search_from, ext)
+        lookup_cache = FileReader._LOOKUP_CACHE
+        try:
+            return lookup_cache[key]
+        except KeyError:
+            pass
+
+        search_dir_prefix = _to_dir_prefix(search_from.parent if search_from.is_file() else search_from)
+        reader = None
+        for conftest_dir_prefix, readers in FileReader._SNAPSHOT:
+            if search_dir_prefix.startswith(conftest_dir_prefix):
+                if reader := readers.get(ext):
+                    break
+        reader = lookup_cache[key] = reader or _DEFAULT_READERS.get(ext)
+        return reader
 
 
 def register_reader(
@@ -94,8 +116,7 @@ def register_reader(
     :param file_reader: A reader callable (e.g. csv.reader, yaml.safe_load) to register for the extension
     :param read_options: File read options to pass to open() when reading the file
     """
-    caller_frame = inspect.stack()[1]
-    caller_file = Path(caller_frame.filename).resolve()
+    caller_file = Path(sys._getframe(1).f_code.co_filename).resolve()
 
     if caller_file.name != "conftest.py":
         raise RuntimeError(
@@ -105,6 +126,15 @@ def register_reader(
     return FileReader.register(caller_file, ext, file_reader, read_options=read_options)
 
 
+def _to_dir_prefix(dir_path: Path) -> str:
+    """Return the case-normalized string form of an absolute directory path with a trailing separator, so that
+    whether a path is under the directory can be checked with str.startswith()
+
+    :param dir_path: An absolute directory path
+    """
+    return os.path.join(os.path.normcase(dir_path), "")
+
+
 def _jsonl_reader(f: IO[str]) -> Generator[Any]:
     """Read a JSON Lines file, yielding one parsed JSON object per non-empty line.
 
@@ -7,8 +7,9 @@ import gzip
 import lzma
 import os
 import re
+import stat
 from collections.abc import Callable, Iterator
-from functools import lru_cache
+from functools import cache
 from pathlib import Path
 from typing import IO, Any, BinaryIO, Literal, TextIO, cast, overload
 
@@ -22,9 +23,11 @@ _COMPRESSION_OPENERS: dict[str, Callable[..., IO[Any]]] = {
     ".xz": lzma.open,
 }
 SUPPORTED_COMPRESSION_EXTENSIONS: tuple[str, ...] = tuple(_COMPRESSION_OPENERS)
+# Environment variable references in a path: $VAR, ${VAR}, or %VAR%
+_ENV_VAR_PATTERN = re.compile(r"\$[A-Za-z_]\w*|\${[A-Za-z_]\w*}|%[A-Za-z_]\w*%")
 
 
-@lru_cache
+@cache
 def resolve_relative_path(
     data_loader_dir_name: str,
     data_loader_root_dir: Path,
@@ -53,47 +56,76 @@ def resolve_relative_path(
     if not search_from.is_relative_to(data_loader_root_dir):
         raise ValueError(f"The test file location {search_from} is not in the subpath of {data_loader_root_dir}")
 
-    data_dirs = []
     if search_from.is_file():
         search_from = search_from.parent
-    for dir_to_search in (search_from, *search_from.parents):
-        data_dir = dir_to_search / data_loader_dir_name
-        if data_dir.exists():
-            data_dirs.append(data_dir.relative_to(data_loader_root_dir.parent))
-
-            # Note: Even if the path looks like a glob pattern, we check it as a literal path first in case it
-            #       actually exists
-            file_or_dir_path = data_dir / relative_path_to_search
-            if os.path.lexists(file_or_dir_path):  # equivalent to Path.exists(follow_symlinks=False) for Python <3.12
-                if file_or_dir_path.is_symlink():
-                    check_circular_symlink(file_or_dir_path)
-                # Ignore if a directory with the same name as the required file (or vice versa) is found
-                if (file_or_dir_path.is_file() and is_file) or (file_or_dir_path.is_dir() and not is_file):
-                    return data_dir, (file_or_dir_path,)
-
-            if is_glob:
-                matched = get_matching_paths(data_dir, str(relative_path_to_search), "file" if is_file else "directory")
-                if matched:
-                    return data_dir, matched
+    data_dirs = _find_data_dirs(data_loader_dir_name, data_loader_root_dir, search_from)
+    for data_dir in data_dirs:
+        # Note: Even if the path looks like a glob pattern, we check it as a literal path first in case it
+        #       actually exists
+        file_or_dir_path = data_dir / relative_path_to_search
+        # NOTE: A single lstat() covers the existence, symlink, and file type checks for regular paths
+        st: os.stat_result | None
+        try:
+            st = os.lstat(file_or_dir_path)
+        except OSError:
+            st = None
+        if st is not None and stat.S_ISLNK(st.st_mode):
+            check_circular_symlink(file_or_dir_path)
+            try:
+                st = os.stat(file_or_dir_path)
+            except OSError:
+                # Broken symlink
+                st = None
+        # Ignore if a directory with the same name as the required file (or vice versa) is found
+        if st is not None and (stat.S_ISREG(st.st_mode) if is_file else stat.S_ISDIR(st.st_mode)):
+            return data_dir, (file_or_dir_path,)
 
-        if dir_to_search == data_loader_root_dir:
-            break
+        if is_glob:
+            matched = get_matching_paths(data_dir, str(relative_path_to_search), "file" if is_file else "directory")
+            if matched:
+                return data_dir, matched
 
     if data_dirs:
+        relative_data_dirs = [x.relative_to(data_loader_root_dir.parent) for x in data_dirs]
         if is_glob:
             err = f"Glob pattern {str(relative_path_to_search)!r} matched no {'files' if is_file else 'directories'}"
         else:
             err = f"Unable to locate the {'file' if is_file else 'directory'} {str(relative_path_to_search)!r}"
-        if len(data_dirs) == 1:
-            err += f" under data directory {str(data_dirs[0])!r}"
+        if len(relative_data_dirs) == 1:
+            err += f" under data directory {str(relative_data_dirs[0])!r}"
         else:
-            listed_data_dirs = "\n".join(f"  - {x}" for x in data_dirs)
+            listed_data_dirs = "\n".join(f"  - {x}" for x in relative_data_dirs)
             err += f" under any of the following data directories:\n{listed_data_dirs}"
     else:
         err = f"Unable to find any data directory '{data_loader_dir_name}'"
     raise DataNotFound(err)
 
 
+def clear_path_lookup_cache() -> None:
+    """Clear memoized data path lookups"""
+    resolve_relative_path.cache_clear()
+    _find_data_dirs.cache_clear()
+
+
+@cache
+def _find_data_dirs(data_loader_dir_name: str, data_loader_root_dir: Path, search_dir: Path) -> tuple[Path, ...]:
+    """Return the data directories found by searching upwards from the given directory up to the root directory, from
+    the nearest one. The result is shared by all path lookups from the same directory
+
+    :param data_loader_dir_name: The data directory name
+    :param data_loader_root_dir: A root directory the lookup should stop at
+    :param search_dir: A directory to start searching from
+    """
+    data_dirs = []
+    for dir_to_search in (search_dir, *search_dir.parents):
+        data_dir = dir_to_search / data_loader_dir_name
+        if data_dir.exists():
+            data_dirs.append(data_dir)
+        if dir_to_search == data_loader_root_dir:
+            break
+    return tuple(data_dirs)
+
+
 def get_matching_paths(root_dir: Path, pattern: str, match_type: Literal["file", "directory"]) -> tuple[Path, ...]:
     """Wrap glob.glob() and detect directory traversal cycles caused by symlinks.
 
@@ -125,8 +157,11 @@ def has_env_vars(path: Path | str) -> bool:
 
     :param path: The path to check
     """
-    pattern = r"(\$[A-Za-z_]\w*|\${[A-Za-z_]\w*}|%[A-Za-z_]\w*%)"
-    return bool(re.search(pattern, str(path)))
+    path_str = str(path)
+    # Most paths contain neither sigil, which a plain substring check rules out without running the regex
+    if "$" not in path_str and "%" not in path_str:
+        return False
+    return _ENV_VAR_PATTERN.search(path_str) is not None
 
 
 def expand_env_vars(value: Path | str) -> str:
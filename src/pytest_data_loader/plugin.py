@@ -1,8 +1,7 @@
 import logging
 import warnings
-from collections.abc import Collection, Iterable
+from collections.abc import Collection
 from itertools import count
-from pathlib import Path
 from typing import Any, cast
 
 import pytest
@@ -23,6 +22,7 @@ from pytest_data_loader.exceptions import DataNotFound
 from pytest_data_loader.fixtures import _pytest_data_loader_cleanup, data_loader  # noqa: F401
 from pytest_data_loader.loaders.cache import SessionFileCache
 from pytest_data_loader.loaders.impl import create_loaders
+from pytest_data_loader.paths import clear_path_lookup_cache
 from pytest_data_loader.types import (
     DataLoaderIniOption,
     DataLoaderLoadAttrs,
@@ -32,13 +32,16 @@ from pytest_data_loader.types import (
     LazyLoadedData,
     LazyLoadedPartData,
     LoadedData,
-    LoadedDataType,
     MissingData,
 )
 from pytest_data_loader.utils import add_error_note, get_data_loader_source
 
 logger = logging.getLogger(__name__)
 
+# Loaded data types checked in hot paths. Kept as tuples so that no union type object is created per isinstance() call
+_SINGLE_LOADED_DATA_TYPES = (LoadedData, LazyLoadedData)
+_LAZY_LOADED_DATA_TYPES = (LazyLoadedData, LazyLoadedPartData)
+
 
 def pytest_addoption(parser: Parser) -> None:
     parser.addini(
@@ -104,11 +107,12 @@ def pytest_configure(config: Config) -> None:
 
 
 def pytest_unconfigure(config: Config) -> None:
-    """Release the session file cache (pooled handles + raw-content LRU)"""
+    """Release the session file cache (pooled handles + raw-content LRU) and memoized data path lookups"""
     try:
         config.stash[STASH_KEY_FILE_CACHE].clear()
     except KeyError:
         pass
+    clear_path_lookup_cache()
 
 
 def pytest_generate_tests(metafunc: Metafunc) -> None:
@@ -158,7 +162,7 @@ def _apply_load_attrs(
                 loader.register_cleanup(metafunc.module)
 
                 loaded = loader.load()
-                if isinstance(loaded, LoadedData | LazyLoadedData):
+                if isinstance(loaded, _SINGLE_LOADED_DATA_TYPES):
                     loaded_data.append(loaded)
                 elif loaded:
                     loaded_data.extend(loaded)
@@ -181,25 +185,21 @@ def _apply_load_attrs(
         else:
             raise ValueError(f"ids: Length ({len(ids)}) does not match number of parameter sets ({len(loaded_data)})")
 
-    values: Iterable[
-        LoadedDataType
-        | LazyLoadedData
-        | LazyLoadedPartData
-        | tuple[Path, LoadedDataType | LazyLoadedData | LazyLoadedPartData]
-        | None
-    ]
-    if data_loader_option.on_missing == DataLoaderOnMissingAction.WARN:
+    if has_missing_data and data_loader_option.on_missing == DataLoaderOnMissingAction.WARN:
         for x in loaded_data:
             if isinstance(x, MissingData):
                 _emit_warning(f"{type(x.error).__name__}: {x.error}", metafunc, loader_idx, load_attrs)
 
-    if loaded_data:
+    # Pick the loop once rather than checking for explicit IDs per item. Explicit IDs match loaded_data in length here
+    values: list[ParameterSet]
+    if ids:
         values = [
-            _generate_parameterset(load_attrs, data_loader_option, x, id_=ids[i] if ids else None)
-            for i, x in enumerate(loaded_data)
+            _generate_parameterset(load_attrs, data_loader_option, x, id_=id_) for x, id_ in zip(loaded_data, ids)
         ]
     else:
-        values = []
+        values = [_generate_parameterset(load_attrs, data_loader_option, x) for x in loaded_data]
+    # The parameter sets hold everything pytest needs from here. Release the intermediate list of loaded data
+    del loaded_data
 
     metafunc.parametrize(load_attrs.fixture_names, values)
 
@@ -208,7 +208,7 @@ def _apply_load_attrs(
 def pytest_fixture_setup(request: SubRequest) -> None:
     """Resolve lazily loaded data to actual data"""
     val = getattr(request, "param", None)
-    if isinstance(val, LazyLoadedData | LazyLoadedPartData):
+    if isinstance(val, _LAZY_LOADED_DATA_TYPES):
         request.param = val.resolve()
 
 
@@ -226,71 +226,100 @@ def _generate_parameterset(
     :param loaded_data: The loaded data
     :param id_: Explicit ID value from a sequence-based ids argument
     """
+    args: tuple[Any, ...]
+    if load_attrs.requires_file_path:
+        args = (loaded_data.file_path, loaded_data.data)
+    else:
+        args = (loaded_data.data,)
+    try:
+        return pytest.param(
+            *args,
+            marks=_generate_param_marks(load_attrs, data_loader_option, loaded_data),
+            id=_generate_param_id(load_attrs, loaded_data, id_),
+        )
+    finally:
+        if isinstance(loaded_data, LazyLoadedPartData):
+            # The part is kept by pytest as the parameter value until the test runs. Drop the ID and marks it no longer
+            # needs
+            object.__setattr__(loaded_data, "meta", None)
 
-    def generate_param_id() -> Any:
-        if id_ is not None:
-            return id_
 
-        if isinstance(loaded_data, MissingData):
-            return repr(loaded_data)
+def _generate_param_id(
+    load_attrs: DataLoaderLoadAttrs,
+    loaded_data: LoadedData | LazyLoadedData | LazyLoadedPartData | MissingData,
+    id_: Any,
+) -> Any:
+    """Generate a parameter ID for the loaded data
 
-        if load_attrs.id_func:
-            if isinstance(loaded_data, LazyLoadedPartData):
-                # When `ids` callable is provided for the @parametrize loader, parameter ID is generated when
-                # LazyLoadedPartData is created
-                param_id = loaded_data.meta["id"]
-                if param_id is not None:
-                    return param_id
-                return repr(loaded_data)
-            if load_attrs.loader.requires_parametrization:
-                assert loaded_data.gidx is not None
-                return load_attrs.id_func(loaded_data.gidx, loaded_data.file_path, loaded_data.data)
-            else:
-                return load_attrs.id_func(loaded_data.file_path, loaded_data.data)
+    :param load_attrs: The load attributes
+    :param loaded_data: The loaded data
+    :param id_: Explicit ID value from a sequence-based ids argument
+    """
+    if id_ is not None:
+        return id_
+
+    if isinstance(loaded_data, MissingData):
+        return repr(loaded_data)
 
-        # Default ID
-        if load_attrs.lazy_loading or not (load_attrs.loader.type == DataLoaderType.PARAMETRIZE):
+    if load_attrs.id_func:
+        if isinstance(loaded_data, LazyLoadedPartData):
+            # When `ids` callable is provided for the @parametrize loader, parameter ID is generated when
+            # LazyLoadedPartData is created
+            assert loaded_data.meta is not None
+            param_id = loaded_data.meta.id
+            if param_id is not None:
+                return param_id
             return repr(loaded_data)
+        if load_attrs.loader.requires_parametrization:
+            assert loaded_data.gidx is not None
+            return load_attrs.id_func(loaded_data.gidx, loaded_data.file_path, loaded_data.data)
         else:
-            return repr(loaded_data.data)
-
-    def generate_param_marks() -> MarkDecorator | Collection[MarkDecorator | Mark]:
-        default_markers: tuple[()] = ()
-        if isinstance(loaded_data, MissingData):
-            on_missing = data_loader_option.on_missing
-            reason = f"{type(loaded_data.error).__name__}: {loaded_data.error}"
-            if on_missing == DataLoaderOnMissingAction.SKIP:
-                marks = pytest.mark.skip(reason=reason)
-            elif on_missing == DataLoaderOnMissingAction.XFAIL:
-                marks = pytest.mark.xfail(reason=reason, run=False)
-            else:
-                marks = None
+            return load_attrs.id_func(loaded_data.file_path, loaded_data.data)
+
+    # Default ID
+    if load_attrs.lazy_loading or load_attrs.loader.type is not DataLoaderType.PARAMETRIZE:
+        return repr(loaded_data)
+    else:
+        return repr(loaded_data.data)
+
+
+def _generate_param_marks(
+    load_attrs: DataLoaderLoadAttrs,
+    data_loader_option: DataLoaderOption,
+    loaded_data: LoadedData | LazyLoadedData | LazyLoadedPartData | MissingData,
+) -> MarkDecorator | Collection[MarkDecorator | Mark]:
+    """Generate parameter marks for the loaded data
+
+    :param load_attrs: The load attributes
+    :param data_loader_option: Data loader options
+    :param loaded_data: The loaded data
+    """
+    default_markers: tuple[()] = ()
+    if isinstance(loaded_data, MissingData):
+        on_missing = data_loader_option.on_missing
+        reason = f"{type(loaded_data.error).__name__}: {loaded_data.error}"
+        if on_missing == DataLoaderOnMissingAction.SKIP:
+            marks = pytest.mark.skip(reason=reason)
+        elif on_missing == DataLoaderOnMissingAction.XFAIL:
+            marks = pytest.mark.xfail(reason=reason, run=False)
+        else:
+            marks = None
+    else:
+        if load_attrs.marker_func is None:
+            return default_markers
         else:
-            if load_attrs.marker_func is None:
-                return default_markers
+            if isinstance(loaded_data, LazyLoadedPartData):
+                # When `marks` callable is provided for the @parametrize loader, marks are generated when
+                # LazyLoadedPartData is created
+                assert loaded_data.meta is not None
+                marks = loaded_data.meta.marks
             else:
-                if isinstance(loaded_data, LazyLoadedPartData):
-                    # When `marks` callable is provided for the @parametrize loader, marks are generated when
-                    # LazyLoadedPartData is created
-                    marks = loaded_data.meta["marks"]
+                if load_attrs.loader.requires_parametrization:
+                    assert loaded_data.gidx is not None
+                    marks = load_attrs.marker_func(loaded_data.gidx, loaded_data.file_path, loaded_data.data)
                 else:
-                    if load_attrs.loader.requires_parametrization:
-                        assert loaded_data.gidx is not None
-                        marks = load_attrs.marker_func(loaded_data.gidx, loaded_data.file_path, loaded_data.data)
-                    else:
-                        marks = load_attrs.marker_func(loaded_data.file_path, loaded_data.data)
-        return marks or default_markers
-
-    args: tuple[Any, ...]
-    if load_attrs.requires_file_path:
-        args = (loaded_data.file_path, loaded_data.data)
-    else:
-        args = (loaded_data.data,)
-    try:
-        return pytest.param(*args, marks=generate_param_marks(), id=generate_param_id())
-    finally:
-        if isinstance(loaded_data, LazyLoadedPartData):
-            loaded_data.meta.clear()
+                    marks = load_attrs.marker_func(loaded_data.file_path, loaded_data.data)
+    return marks or default_markers
 
 
 def _emit_warning(msg: str, metafunc: Metafunc, loader_idx: int, load_attrs: DataLoaderLoadAttrs) -> None:
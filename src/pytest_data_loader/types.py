@@ -7,7 +7,20 @@ from collections.abc import Callable, Collection, Iterable, Mapping
 from dataclasses import dataclass, field
 from enum import auto
 from pathlib import Path
-from typing import IO, Any, Literal, ParamSpec, Protocol, TypeAlias, TypedDict, TypeVar, Union, runtime_checkable
+from typing import (
+    IO,
+    Any,
+    Literal,
+    NamedTuple,
+    NoReturn,
+    ParamSpec,
+    Protocol,
+    TypeAlias,
+    TypedDict,
+    TypeVar,
+    Union,
+    runtime_checkable,
+)
 
 import pytest
 from pytest import Config, Mark, MarkDecorator
@@ -43,12 +56,31 @@ PathFilterFunc: TypeAlias = Callable[[Path], bool]
 PathMarkerFunc: TypeAlias = Callable[[Path], PytestMarkType | None] | Callable[[int, Path], PytestMarkType | None]
 PathIdFunc: TypeAlias = Callable[[Path], str | None] | Callable[[int, Path], str | None]
 
+# Immutable scalar types HashableDict.freeze() returns as is without the abstract collection checks
+_FROZEN_LEAF_TYPES = frozenset((str, bytes, int, float, bool, type(None)))
+
 
 class HashableDict(dict[str, Any]):
-    """A hashable dictionary"""
+    """A hashable dictionary. Mutation is disallowed so that instances can be safely shared and used as cache keys"""
+
+    # The hash is computed on first use and kept, as the content can not change
+    __slots__ = ("_hash",)
 
     def __hash__(self) -> int:  # type: ignore[override]
-        return hash(frozenset((k, HashableDict.freeze(v)) for k, v in self.items()))
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash: int = hash(frozenset((k, HashableDict.freeze(v)) for k, v in self.items()))
+            return self._hash
+
+    def __reduce__(self) -> tuple[type[HashableDict], tuple[dict[str, Any]]]:
+        return type(self), (dict(self),)
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError(f"{type(self).__name__} is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
 
     @staticmethod
     def freeze(obj: Any) -> Any:
@@ -56,14 +88,19 @@ class HashableDict(dict[str, Any]):
 
         :param obj: Any object
         """
-        if isinstance(obj, HashableDict | Mapping):
+        if type(obj) in _FROZEN_LEAF_TYPES:
+            return obj
+        elif isinstance(obj, Mapping):
             return frozenset((k, HashableDict.freeze(v)) for k, v in obj.items())
-        elif isinstance(obj, tuple | Collection) and not isinstance(obj, str | bytes):
+        elif isinstance(obj, Collection) and not isinstance(obj, (str, bytes)):
             return tuple(HashableDict.freeze(x) for x in obj)
         else:
             return obj
 
 
+EMPTY_READ_OPTIONS = HashableDict()
+
+
 class DataLoaderType(StrEnum):
     LOAD = auto()
     PARAMETRIZE = auto()
@@ -242,9 +279,13 @@ _LOADER_FUNC_PUBLIC_NAMES = {
     DataLoaderFunctionType.READ_OPTIONS_FUNC: "read_options",
 }
 DataLoaderFunctionType._validate()
+# Each loader function type is also the name of the DataLoaderLoadAttrs field holding the function
+_LOADER_FUNC_TYPES = tuple(DataLoaderFunctionType)
 
 
-@dataclass(frozen=True, kw_only=True, slots=True, repr=False)
+# NOTE: Data objects are compared by identity (eq=False). Field-wise comparison and hashing would walk the loaded data,
+#       and hashing would fail for unhashable data such as lists
+@dataclass(frozen=True, kw_only=True, slots=True, repr=False, eq=False)
 class Data(ABC):
     gidx: int | None = None
     file_path: Path
@@ -264,7 +305,7 @@ class Data(ABC):
         return None
 
 
-@dataclass(frozen=True, kw_only=True, slots=True, repr=False)
+@dataclass(frozen=True, kw_only=True, slots=True, repr=False, eq=False)
 class MissingData(Data):
     error: DataNotFound
 
@@ -276,12 +317,12 @@ class MissingData(Data):
         return None
 
 
-@dataclass(frozen=True, kw_only=True, slots=True, repr=False)
+@dataclass(frozen=True, kw_only=True, slots=True, repr=False, eq=False)
 class LoadedData(Data):
     data: LoadedDataType
 
 
-@dataclass(frozen=True, kw_only=True, slots=True, repr=False)
+@dataclass(frozen=True, kw_only=True, slots=True, repr=False, eq=False)
 class LazyLoadedDataABC(Data):
     resolver: Callable[..., LoadedData | Iterable[LoadedData]]
 
@@ -294,7 +335,7 @@ class LazyLoadedDataABC(Data):
         raise NotImplementedError
 
 
-@dataclass(frozen=True, kw_only=True, slots=True, repr=False)
+@dataclass(frozen=True, kw_only=True, slots=True, repr=False, eq=False)
 class LazyLoadedData(LazyLoadedDataABC):
     def resolve(self) -> LoadedDataType:
         loaded_data = self.resolver()
@@ -302,12 +343,19 @@ class LazyLoadedData(LazyLoadedDataABC):
         return loaded_data.data
 
 
-@dataclass(frozen=True, kw_only=True, slots=True, repr=False)
+class PartMeta(NamedTuple):
+    """Parameter ID and marks of a part, generated when LazyLoadedPartData is created"""
+
+    id: Any
+    marks: PytestMarkType | None
+
+
+@dataclass(frozen=True, kw_only=True, slots=True, repr=False, eq=False)
 class LazyLoadedPartData(LazyLoadedDataABC):
     idx: int
     pos: int | None = None
-    # Temporarily store id and marks
-    meta: dict[str, Any]
+    # Temporarily store id and marks. Released once the parameter set is generated
+    meta: PartMeta | None
 
     def __repr__(self) -> str:
         parent_dir = (self.file_path_relative or self.file_path).parent
@@ -330,7 +378,7 @@ class DataLoaderLoadAttrs:
     lazy_loading: bool = True
     recursive: bool = False
     reader: FileReader | None = None
-    read_options: HashableDict = field(default_factory=HashableDict)
+    read_options: HashableDict = EMPTY_READ_OPTIONS
     onload_func: Callable[..., Any] | None = None
     parametrizer_func: Callable[..., Iterable[Any]] | None = None
     filter_func: Callable[..., bool] | None = None
@@ -340,27 +388,17 @@ class DataLoaderLoadAttrs:
     marker_func: Callable[..., PytestMarkType | None] | None = None
     id_func: Callable[..., Any] | None = None
     ids: tuple[Any, ...] | None = None
-
-    @property
-    def requires_file_path(self) -> bool:
-        """Return True if two fixture names are configured, meaning the file path is passed as a separate fixture."""
-        return len(self.fixture_names) == 2
+    # True if two fixture names are configured, meaning the file path is passed as a separate fixture
+    requires_file_path: bool = field(init=False)
 
     def __post_init__(self) -> None:
-        from pytest_data_loader.utils import normalize_loader_func
-        from pytest_data_loader.validators import validate_loader_func
-
-        for f, func_type in [
-            (self.onload_func, DataLoaderFunctionType.ONLOAD_FUNC),
-            (self.parametrizer_func, DataLoaderFunctionType.PARAMETRIZER_FUNC),
-            (self.filter_func, DataLoaderFunctionType.FILTER_FUNC),
-            (self.process_func, DataLoaderFunctionType.PROCESS_FUNC),
-            (self.reader_func, DataLoaderFunctionType.READER_FUNC),
-            (self.read_options_func, DataLoaderFunctionType.READ_OPTIONS_FUNC),
-            (self.marker_func, DataLoaderFunctionType.MARKER_FUNC),
-            (self.id_func, DataLoaderFunctionType.ID_FUNC),
-        ]:
-            if f is not None:
+        object.__setattr__(self, "requires_file_path", len(self.fixture_names) == 2)
+        for func_type in _LOADER_FUNC_TYPES:
+            if (f := getattr(self, func_type)) is not None:
+                # NOTE: Imported here to avoid circular imports, and only when a loader function is given
+                from pytest_data_loader.utils import normalize_loader_func
+                from pytest_data_loader.validators import validate_loader_func
+
                 len_func_args = validate_loader_func(f, loader=self.loader, func_type=func_type)
                 object.__setattr__(
                     self, func_type, normalize_loader_func(self.loader, f, func_type, num_defined_args=len_func_args)
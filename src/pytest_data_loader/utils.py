@@ -2,20 +2,16 @@ from __future__ import annotations
 
 import ast
 import codecs
-import inspect
 import keyword
 import re
 import sys
 from collections.abc import Callable
 from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, ParamSpec, TypeVar
+from typing import Any
 
 from pytest_data_loader.types import DataLoader, DataLoaderFunctionType, DataLoaderType
 
-R = TypeVar("R")
-P = ParamSpec("P")
-
 
 def is_valid_fixture_name(name: str) -> bool:
     """Check if the given name is valid as a fixture name
@@ -32,7 +28,7 @@ def get_max_allowed_loader_func_args(loader: DataLoader, func_type: DataLoaderFu
     :param loader: The data loader the function is associated with
     :param func_type: Type of the loader function
     """
-    if loader.type == DataLoaderType.PARAMETRIZE_DIR:
+    if loader.type is DataLoaderType.PARAMETRIZE_DIR:
         # @parametrize_dir
         if func_type == DataLoaderFunctionType.FILTER_FUNC:
             # (path)
@@ -45,7 +41,7 @@ def get_max_allowed_loader_func_args(loader: DataLoader, func_type: DataLoaderFu
             return 2
     else:
         # @load or @parametrize
-        if loader.type == DataLoaderType.PARAMETRIZE and func_type in (
+        if loader.type is DataLoaderType.PARAMETRIZE and func_type in (
             DataLoaderFunctionType.MARKER_FUNC,
             DataLoaderFunctionType.ID_FUNC,
             DataLoaderFunctionType.PROCESS_FUNC,
@@ -72,25 +68,11 @@ def normalize_loader_func(
     :param num_defined_args: Parameter count of loader_func. When provided, the signature inspection is skipped
     """
 
-    def inject_error_context(file_path: Path) -> Callable[[Callable[P, R]], Callable[P, R]]:
-        """Inject error context to a loader function call"""
-
-        def decorator(f: Callable[P, R]) -> Callable[P, R]:
-            @wraps(f)
-            def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-                try:
-                    return f(*args, **kwargs)
-                except Exception as e:
-                    err = (
-                        f"Error while processing '{func_type.public_name}' callable for "
-                        f"'{file_path.name}' ({file_path})"
-                    )
-                    add_error_note(e, err)
-                    raise
-
-            return wrapper
-
-        return decorator
+    def add_error_context(e: Exception, file_path: Path) -> None:
+        """Add error context to an exception raised from the loader function call"""
+        add_error_note(
+            e, f"Error while processing '{func_type.public_name}' callable for '{file_path.name}' ({file_path})"
+        )
 
     if num_defined_args is None:
         from pytest_data_loader.validators import validate_loader_func
@@ -98,34 +80,42 @@ def normalize_loader_func(
         num_defined_args = validate_loader_func(loader_func, loader=loader, func_type=func_type)
 
     max_allowed_args = get_max_allowed_loader_func_args(loader, func_type)
-    no_data_arg = loader.type == DataLoaderType.PARAMETRIZE_DIR and func_type != DataLoaderFunctionType.PROCESS_FUNC
+    no_data_arg = loader.type is DataLoaderType.PARAMETRIZE_DIR and func_type is not DataLoaderFunctionType.PROCESS_FUNC
     supports_idx = (no_data_arg and max_allowed_args >= 2) or (not no_data_arg and max_allowed_args >= 3)
 
+    # NOTE: The error context is added in place rather than by wrapping loader_func per call, as these functions are
+    #       called once per loaded file or parametrized item
     @wraps(loader_func)
     def normalized_func_with_idx(idx: int, file_path: Path, data: Any) -> Any:
-        wrapped = inject_error_context(file_path)(loader_func)
-        if no_data_arg:
-            if num_defined_args == 2:
-                return wrapped(idx, file_path)
-            else:
-                return wrapped(file_path)
-        else:
-            if num_defined_args == 3:
-                return wrapped(idx, file_path, data)
-            elif num_defined_args == 2:
-                return wrapped(file_path, data)
+        try:
+            if no_data_arg:
+                if num_defined_args == 2:
+                    return loader_func(idx, file_path)
+                else:
+                    return loader_func(file_path)
             else:
-                return wrapped(data)
+                if num_defined_args == 3:
+                    return loader_func(idx, file_path, data)
+                elif num_defined_args == 2:
+                    return loader_func(file_path, data)
+                else:
+                    return loader_func(data)
+        except Exception as e:
+            add_error_context(e, file_path)
+            raise
 
     @wraps(loader_func)
     def normalized_func_without_idx(file_path: Path, data: Any) -> Any:
-        wrapped = inject_error_context(file_path)(loader_func)
-        if num_defined_args == 2:
-            return wrapped(file_path, data)
-        elif max_allowed_args == 1:
-            return wrapped(file_path)
-        else:
-            return wrapped(data)
+        try:
+            if num_defined_args == 2:
+                return loader_func(file_path, data)
+            elif max_allowed_args == 1:
+                return loader_func(file_path)
+            else:
+                return loader_func(data)
+        except Exception as e:
+            add_error_context(e, file_path)
+            raise
 
     if supports_idx:
         return normalized_func_with_idx
@@ -146,19 +136,17 @@ def get_data_loader_source(test_func: Callable[..., Any], position: int, data_lo
     :param data_loader_name: Expected data loader name at that position. Used as a sanity check to guard against
                              import-resolution edge cases
     """
+    code = getattr(test_func, "__code__", None)
+    if code is None:
+        return None
     try:
-        source_file = inspect.getsourcefile(test_func)
-        if source_file is None:
-            return None
-        with open(source_file, encoding="utf-8") as f:
+        with open(code.co_filename, encoding="utf-8") as f:
             file_source = f.read()
         tree = ast.parse(file_source)
     except Exception:
         return None
 
-    code = getattr(test_func, "__code__", None)
-    func_lineno: int | None = code.co_firstlineno if code is not None else None
-    func_node = _find_func_node(tree, test_func.__name__, func_lineno)
+    func_node = _find_func_node(tree, test_func.__name__, code.co_firstlineno)
     if func_node is None:
         return None
 
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import glob
 import inspect
+import sys
 import warnings
 from collections.abc import Callable, Iterable
+from functools import cache
 from inspect import Parameter
 from pathlib import Path
+from types import FunctionType
 from typing import Any
 
 from pytest import Mark, MarkDecorator
@@ -13,6 +16,7 @@ from pytest import Mark, MarkDecorator
 from pytest_data_loader.constants import ROOT_DIR
 from pytest_data_loader.paths import check_circular_symlink, expand_env_vars, has_env_vars
 from pytest_data_loader.types import (
+    EMPTY_READ_OPTIONS,
     DataLoader,
     DataLoaderFunctionType,
     DataLoaderType,
@@ -22,6 +26,11 @@ from pytest_data_loader.types import (
 )
 from pytest_data_loader.utils import get_max_allowed_loader_func_args, is_valid_fixture_name
 
+# Paths that are never accepted as a data loader path
+_INVALID_PATHS = frozenset((Path("."), Path(".."), Path(ROOT_DIR)))
+_SUPPORTED_READ_OPTIONS = frozenset(FileReadOptions.__annotations__)
+_SUPPORTED_READ_MODES = frozenset(("r", "rt", "rb"))
+
 
 def validate_loader_options(
     *,
@@ -71,7 +80,7 @@ def validate_loader_options(
     validate_reader(reader)
 
     read_options_func = None
-    if read_options is not None and loader.type == DataLoaderType.PARAMETRIZE_DIR:
+    if read_options is not None and loader.type is DataLoaderType.PARAMETRIZE_DIR:
         if not callable(read_options) and not isinstance(read_options, dict):
             raise TypeError(f"read_options: Must be a callable or a dict, but got {_get_type_name(read_options)}")
         if callable(read_options):
@@ -96,7 +105,7 @@ def validate_loader_options(
         lazy_loading=lazy_loading,
         recursive=recursive,
         reader=reader,
-        read_options=HashableDict(read_options or {}),
+        read_options=HashableDict(read_options) if read_options else EMPTY_READ_OPTIONS,
         onload_func=onload_func,
         parametrizer_func=parametrizer_func,
         filter_func=filter_func,
@@ -126,8 +135,9 @@ def validate_fixture_names(value: Any) -> tuple[str, ...]:
         )
 
     if isinstance(value, str):
-        normalized_names = tuple(x.strip() for x in value.split(","))
+        normalized_names = _split_fixture_names(value)
     else:
+        # NOTE: This returns the given tuple itself unless it is a tuple subclass (eg. namedtuple)
         normalized_names = tuple(value)
 
     err = "Invalid fixture_names value"
@@ -141,6 +151,17 @@ def validate_fixture_names(value: Any) -> tuple[str, ...]:
     return normalized_names
 
 
+@cache
+def _split_fixture_names(value: str) -> tuple[str, ...]:
+    """Split a comma-separated fixture_names string into stripped names.
+
+    Memoized so that decorators using the same string share a single tuple of interned names
+
+    :param value: Comma-separated fixture names
+    """
+    return tuple(sys.intern(x.strip()) for x in value.split(","))
+
+
 def validate_path(value: Any, *, loader: DataLoader, recursive: bool) -> Path | tuple[Path, ...]:
     """Validate and normalize the path argument.
 
@@ -151,12 +172,12 @@ def validate_path(value: Any, *, loader: DataLoader, recursive: bool) -> Path |
     :param loader: The data loader being configured; used for context-specific validation
     :param recursive: Whether recursive directory loading is requested; used to detect misconfigured glob patterns
     """
-    if isinstance(value, list | tuple):
+    if isinstance(value, (list, tuple)):
         if not loader.requires_parametrization:
             raise ValueError(f"Multi-path is not supported for @{loader.__name__} loader")
         if len(value) == 0:
             raise ValueError("path: Multi-path list must not be empty")
-        if not all(isinstance(p, Path | str) for p in value):
+        if not all(isinstance(p, (Path, str)) for p in value):
             raise TypeError(
                 f"path: Each path must a be a string or pathlib.Path object, but got "
                 f"{[_get_type_name(p) for p in value]}"
@@ -168,7 +189,7 @@ def validate_path(value: Any, *, loader: DataLoader, recursive: bool) -> Path |
             result.append(_validate_single_path(p, loader=loader, recursive=recursive))
         return tuple(result)
     else:
-        if not isinstance(value, Path | str):
+        if not isinstance(value, (Path, str)):
             raise TypeError(f"path: Must be a string or pathlib.Path object, but got {_get_type_name(value)}")
         return _validate_single_path(value, loader=loader, recursive=recursive)
 
@@ -182,8 +203,8 @@ def _validate_single_path(path: Path | str, *, loader: DataLoader, recursive: bo
     """
     if has_env_vars(path):
         path = expand_env_vars(path)
-    path_ = Path(path)
-    if path_ in (Path("."), Path(".."), Path(ROOT_DIR)):
+    path_ = path if isinstance(path, Path) else Path(path)
+    if path_ in _INVALID_PATHS:
         raise ValueError(f"Invalid path value: {str(path)!r}")
     if glob.has_magic(str(path_)):
         if not loader.requires_parametrization:
@@ -221,20 +242,11 @@ def validate_loader_func(loader_func: Any, *, loader: DataLoader, func_type: Dat
     if not callable(loader_func):
         raise TypeError(f"{func_type.public_name}: Must be a callable, but got {_get_type_name(loader_func)}")
 
-    try:
-        sig = inspect.signature(loader_func)
-    except ValueError as e:
-        raise ValueError(f"Unsupported '{func_type.public_name}' callable definition: {loader_func!r}") from e
-
-    parameters = sig.parameters
-
-    has_var_positional = any(p.kind == Parameter.VAR_POSITIONAL for p in parameters.values())
-    positional_kinds = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
-    num_explicit = sum(1 for p in parameters.values() if p.kind in positional_kinds)
+    num_explicit, has_var_positional, positional_only = _inspect_positional_args(loader_func, func_type)
 
     max_allowed_args = get_max_allowed_loader_func_args(loader, func_type)
     err = None
-    if not all(p.kind in (*positional_kinds, Parameter.VAR_POSITIONAL) for p in parameters.values()):
+    if not positional_only:
         err = "Only positional arguments are allowed"
     elif (has_var_positional and num_explicit > max_allowed_args) or (
         not has_var_positional and not 0 < num_explicit < max_allowed_args + 1
@@ -251,6 +263,43 @@ def validate_loader_func(loader_func: Any, *, loader: DataLoader, func_type: Dat
     return max_allowed_args if has_var_positional else num_explicit
 
 
+def _inspect_positional_args(
+    loader_func: Callable[..., Any], func_type: DataLoaderFunctionType
+) -> tuple[int, bool, bool]:
+    """Return the number of explicit positional parameters of the loader function, whether it takes *args, and whether
+    it takes positional parameters only
+
+    :param loader_func: Loader function
+    :param func_type: Type of the loader function
+    """
+    code = getattr(loader_func, "__code__", None)
+    if (
+        isinstance(loader_func, FunctionType)
+        and code is not None
+        and not hasattr(loader_func, "__wrapped__")
+        and not hasattr(loader_func, "__signature__")
+    ):
+        # Plain Python function. Read the parameters from the code object rather than building a Signature
+        return (
+            code.co_argcount,
+            bool(code.co_flags & inspect.CO_VARARGS),
+            not code.co_kwonlyargcount and not code.co_flags & inspect.CO_VARKEYWORDS,
+        )
+
+    try:
+        sig = inspect.signature(loader_func)
+    except ValueError as e:
+        raise ValueError(f"Unsupported '{func_type.public_name}' callable definition: {loader_func!r}") from e
+
+    parameters = sig.parameters
+    positional_kinds = (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD)
+    return (
+        sum(1 for p in parameters.values() if p.kind in positional_kinds),
+        any(p.kind == Parameter.VAR_POSITIONAL for p in parameters.values()),
+        all(p.kind in (*positional_kinds, Parameter.VAR_POSITIONAL) for p in parameters.values()),
+    )
+
+
 def validate_reader(reader: Any) -> None:
     """Validate the reader
 
@@ -271,9 +320,9 @@ def validate_read_options(read_options: Any) -> None:
         return
     if not isinstance(read_options, dict):
         raise TypeError(f"read_options: Must be a dict, but got {_get_type_name(read_options)}")
-    if unsupported := set(read_options.keys()).difference(set(FileReadOptions.__annotations__.keys())):
+    if unsupported := read_options.keys() - _SUPPORTED_READ_OPTIONS:
         raise ValueError(f"read_options: Unsupported read options: {', '.join(unsupported)}")
-    if (mode := read_options.get("mode")) and mode not in ("r", "rt", "rb"):
+    if (mode := read_options.get("mode")) and mode not in _SUPPORTED_READ_MODES:
         raise ValueError(f"read_options: Invalid read mode: {mode}")
 
 
@@ -1,5 +1,6 @@
 import csv
 from collections.abc import Iterator
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -98,5 +99,11 @@ def test_parametrize_dir_with_csv_reader(file_path: Path, data: Iterator[list[st
 
 
 def get_expected_data(file_path: Path, read_options: dict[str, Any]) -> list[str]:
-    with open(file_path, **read_options) as f:
+    return _read_lines(file_path, tuple(sorted(read_options.items())))
+
+
+@cache
+def _read_lines(file_path: Path, read_options: tuple[tuple[str, Any], ...]) -> list[str]:
+    # Parametrized tests compare against the same file for every case. Read each file only once
+    with open(file_path, **dict(read_options)) as f:
         return f.read().splitlines()
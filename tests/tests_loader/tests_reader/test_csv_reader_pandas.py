@@ -1,3 +1,4 @@
+from functools import cache
 from pathlib import Path
 
 import pandas
@@ -53,6 +54,7 @@ def test_parametrize_dir_with_pandas(file_path: Path, df: pandas.DataFrame) -> N
     assert len(rows) + 1 == len(expected_data)
 
 
+@cache
 def get_expected_data(file_path: Path) -> list[str]:
     with open(file_path) as f:
         return f.read().splitlines()
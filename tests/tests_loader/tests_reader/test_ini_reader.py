@@ -8,10 +8,9 @@ from tests.paths import PATH_INI_FILE, PATH_INI_FILE_DIR
 
 pytestmark = pytest.mark.readers
 
-parser = ConfigParser()
-
 
 def ini_file_reader(f: IO[str]) -> ConfigParser:
+    parser = ConfigParser()
     parser.read_file(f)
     return parser
 
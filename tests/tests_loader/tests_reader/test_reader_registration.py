@@ -40,3 +40,25 @@ def test_reader_registration(with_read_options: bool) -> None:
 
     FileReader._unregister(fake_conftest_path, ext)
     assert FileReader.get_registered_reader(fake_conftest_path, ext) is None
+
+
+def test_reader_lookup_reflects_registration_changes(tmp_path: Path) -> None:
+    """Test that memoized reader lookups are invalidated when a closer conftest registers or unregisters a reader"""
+    ext = ".dummy"
+    outer_conftest_path = tmp_path / "conftest.py"
+    inner_conftest_path = tmp_path / "inner" / "conftest.py"
+    search_from = tmp_path / "inner" / "test_something.py"
+
+    outer_file_reader = FileReader.register(outer_conftest_path, ext, TextIOWrapper)
+    try:
+        assert FileReader.get_registered_reader(search_from, ext) is outer_file_reader
+
+        inner_file_reader = FileReader.register(inner_conftest_path, ext, TextIOWrapper)
+        try:
+            assert FileReader.get_registered_reader(search_from, ext) is inner_file_reader
+        finally:
+            FileReader._unregister(inner_conftest_path, ext)
+        assert FileReader.get_registered_reader(search_from, ext) is outer_file_reader
+    finally:
+        FileReader._unregister(outer_conftest_path, ext)
+    assert FileReader.get_registered_reader(search_from, ext) is None
@@ -1,3 +1,4 @@
+import inspect
 from pathlib import Path
 from typing import Any
 
@@ -35,3 +36,18 @@ class TestDataLoaderSetup:
         assert load_attr.fixture_names == fixtures
         assert load_attr.path == Path(path)
         assert load_attr.requires_file_path == (len(fixtures) == 2)
+        assert load_attr.search_from == Path(inspect.getabsfile(test_something))
+
+    def test_data_loader_setup_search_from_is_shared_per_file(self) -> None:
+        """Test that test functions defined in the same file share the resolved search_from path"""
+
+        @load("data", "fake.txt")
+        def test_something1(data: Any) -> None: ...
+
+        @load("data", "fake.txt")
+        def test_something2(data: Any) -> None: ...
+
+        (load_attrs1,) = getattr(test_something1, PYTEST_DATA_LOADER_ATTRS)
+        (load_attrs2,) = getattr(test_something2, PYTEST_DATA_LOADER_ATTRS)
+        assert load_attrs1.search_from == Path(inspect.getabsfile(test_something1))
+        assert load_attrs1.search_from is load_attrs2.search_from
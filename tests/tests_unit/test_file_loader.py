@@ -19,6 +19,7 @@ from pytest_data_loader.types import (
     LazyLoadedData,
     LazyLoadedPartData,
     LoadedData,
+    PartMeta,
 )
 from tests.paths import (
     ABS_PATH_LOADER_DIR,
@@ -100,9 +101,7 @@ class TestFileLoader:
                             repr(lazy_loaded_part)
                             == f"{lazy_loaded_part.file_path_relative}:part{lazy_loaded_part.idx + 1}"
                         )
-                    assert set(lazy_loaded_part.meta.keys()) == {"marks", "id"}
-                    assert lazy_loaded_part.meta["id"] == str(i)
-                    assert lazy_loaded_part.meta["marks"] == marks
+                    assert lazy_loaded_part.meta == PartMeta(id=str(i), marks=marks)
             else:
                 assert isinstance(loaded_data, LazyLoadedData)
                 assert loaded_data.file_path == abs_file_path
@@ -5,7 +5,7 @@ import pytest
 from pytest import FixtureRequest
 
 from pytest_data_loader.constants import DEFAULT_LOADER_DIR_NAME
-from pytest_data_loader.paths import resolve_relative_path
+from pytest_data_loader.paths import _find_data_dirs, clear_path_lookup_cache, resolve_relative_path
 from tests.paths import (
     ABS_PATH_LOADER_DIR,
     PATH_HIDDEN_DIR,
@@ -148,6 +148,27 @@ class TestPathResolver:
                 is_file=True,
             )
 
+    def test_path_resolver_should_share_data_dir_lookup_per_directory(self, tmp_path: Path) -> None:
+        """Test that the upward data directory search is done once per directory and shared by different paths"""
+        data_dir = tmp_path / DEFAULT_LOADER_DIR_NAME
+        data_dir.mkdir()
+        (data_dir / "a.txt").touch()
+        (data_dir / "b.txt").touch()
+        search_dir = tmp_path / "tests"
+        search_dir.mkdir()
+
+        misses = _find_data_dirs.cache_info().misses
+        for name in ("a.txt", "b.txt"):
+            data_dir_path, (resolved_path,) = resolve_relative_path(
+                DEFAULT_LOADER_DIR_NAME, tmp_path, Path(name), search_dir, is_file=True
+            )
+            assert data_dir_path == data_dir
+            assert resolved_path == data_dir / name
+        assert _find_data_dirs.cache_info().misses == misses + 1
+
+        clear_path_lookup_cache()
+        assert _find_data_dirs.cache_info().currsize == resolve_relative_path.cache_info().currsize == 0
+
 
 class TestPathResolverGlob:
     """Tests for the relative path resolver with glob patterns."""
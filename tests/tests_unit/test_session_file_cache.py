@@ -3,7 +3,7 @@ from __future__ import annotations
 import sys
 from io import StringIO
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -454,3 +454,39 @@ class TestHashableDictOrderIndependence:
         cache.get_content(key_ab, on_miss)
         cache.get_content(key_ba, on_miss)  # must be a cache hit
         assert on_miss.call_count == 1, "Order-variant keys must resolve to the same cache entry"
+
+
+class TestHashableDictImmutability:
+    """Tests for HashableDict immutability, which allows a single empty instance to be shared."""
+
+    @pytest.mark.parametrize(
+        "mutate",
+        [
+            lambda d: d.__setitem__("mode", "rb"),
+            lambda d: d.__delitem__("mode"),
+            lambda d: d.update(mode="rb"),
+            lambda d: d.setdefault("errors", "strict"),
+            lambda d: d.pop("mode"),
+            lambda d: d.popitem(),
+            lambda d: d.clear(),
+        ],
+    )
+    def test_mutation_is_rejected(self, mutate: Any) -> None:
+        """Test that any in-place mutation of a HashableDict raises TypeError and leaves the content untouched."""
+        d = HashableDict({"mode": "r"})
+        with pytest.raises(TypeError, match="HashableDict is immutable"):
+            mutate(d)
+        assert d == {"mode": "r"}
+
+    def test_copy_is_a_plain_mutable_dict(self) -> None:
+        """Test that dict(HashableDict) produces a mutable copy for callers that need to merge options."""
+        options = dict(HashableDict({"mode": "r"}))
+        options["encoding"] = "utf-8"
+        assert options == {"mode": "r", "encoding": "utf-8"}
+
+    def test_hash_is_computed_once(self) -> None:
+        """Test that the hash of a HashableDict is cached after the first computation."""
+        d = HashableDict({"mode": "r", "encoding": "utf-8"})
+        assert hash(d) == hash(HashableDict({"encoding": "utf-8", "mode": "r"}))
+        with patch.object(HashableDict, "freeze", side_effect=AssertionError("hash was recomputed")):
+            assert hash(d) == hash(d)
@@ -0,0 +1,42 @@
+from collections.abc import Callable
+from functools import wraps
+from typing import Any
+
+import pytest
+
+from pytest_data_loader.types import DataLoaderFunctionType
+from pytest_data_loader.validators import _inspect_positional_args
+
+pytestmark = pytest.mark.unittest
+
+
+def _wrap(f: Callable[..., Any]) -> Callable[..., Any]:
+    @wraps(f)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return f(*args, **kwargs)
+
+    return wrapper
+
+
+class TestInspectPositionalArgs:
+    """Tests for the loader function parameter inspection used by validate_loader_func()."""
+
+    @pytest.mark.parametrize(
+        "func, expected",
+        [
+            (lambda: None, (0, False, True)),
+            (lambda x: None, (1, False, True)),
+            (lambda x, y=1: None, (2, False, True)),
+            (lambda x, /, y: None, (2, False, True)),
+            (lambda *args: None, (0, True, True)),
+            (lambda x, *args: None, (1, True, True)),
+            (lambda x, *, y: None, (1, False, False)),
+            (lambda x, **kwargs: None, (1, False, False)),
+        ],
+    )
+    def test_code_object_matches_signature(self, func: Callable[..., Any], expected: tuple[int, bool, bool]) -> None:
+        """Test that reading a plain function's code object gives the same result as inspect.signature()."""
+        func_type = DataLoaderFunctionType.ONLOAD_FUNC
+        assert _inspect_positional_args(func, func_type) == expected
+        # functools.wraps() sets __wrapped__, which forces the inspect.signature() path
+        assert _inspect_positional_args(_wrap(func), func_type) == expected